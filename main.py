@@ -18,6 +18,7 @@ Concepts from class I used here:
 
 from mortgage import MortgagePayment
 from exchange_rates import ExchangeRates
+import functools
 import glob
 
 
@@ -70,8 +71,13 @@ def run_mortgage_flow() -> None:
 
 
 # running the exchange rate part
+@functools.lru_cache(maxsize=1)
 def _autodetect_csv() -> str | None:
-    """Check if a Bank of Canada CSV file is already in this folder."""
+    """
+    Check if a Bank of Canada CSV file is already in this folder.
+    I only glob the folder once per process; if files get moved around
+    mid-run, call _autodetect_csv.cache_clear() first.
+    """
     matches = sorted(glob.glob("BankOfCanadaExchangeRates*.csv"))
     return matches[-1] if matches else None
 
@@ -86,7 +92,8 @@ def run_fx_flow() -> None:
     else:
         print(f"Using data file: {csv_path}")
 
-    xr = ExchangeRates(csv_path)
+    # Read the rate now (one open + parse, or just the .rate sidecar on later runs).
+    xr = ExchangeRates(csv_path, eager=True)
 
     amount = _get_float("Enter amount (e.g., 100000): ")
 
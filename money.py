@@ -0,0 +1,26 @@
+"""
+FINE 3300 – Assignment 1
+Author: Dimitar Atanasov
+
+File: money.py
+
+What I do with this file:
+- One place for the "round to cents" rule, so mortgage.py and exchange_rates.py
+  can't end up rounding differently.
+"""
+
+import math
+from decimal import ROUND_HALF_UP, Decimal
+
+_CENT = Decimal("0.01")
+
+
+# helper: round to cents
+def to_cents(x: float) -> float:
+    """Round an amount to cents, half-up, using Decimal."""
+    if not math.isfinite(x):
+        return x
+    # A double is good for 15 significant digits, so reading x back at 15 digits
+    # gives the value the arithmetic meant (8271975 * 1.3698 -> 11330951.355,
+    # not 11330951.354999999) before I round the half cent up.
+    return float(Decimal(format(x, ".15g")).quantize(_CENT, rounding=ROUND_HALF_UP))
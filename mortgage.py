@@ -18,7 +18,71 @@ Formulas I used:
   payment = principal / PVA(r, n)
 """
 
-from typing import Tuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from money import to_cents
+
+# Payments per year for the four level schedules, in the order payments() returns them.
+_FREQUENCIES: Tuple[int, ...] = (12, 24, 26, 52)
+
+
+class Payments(NamedTuple):
+    """The six payments, rounded to cents. It's still a tuple, so unpacking works as before."""
+
+    monthly: float
+    semi_monthly: float
+    bi_weekly: float
+    weekly: float
+    rapid_bi_weekly: float
+    rapid_weekly: float
+
+
+# The rate helpers are plain functions with a cache: the same mortgage asked
+# again (same j, EAR, r, n) just gets its answer back instead of redoing the pow.
+
+# helper: present-value factor
+@lru_cache(maxsize=256)
+def _pva(r: float, n: int) -> float:
+    """Present value of an annuity-immediate. Handles r = 0."""
+    if r == 0:
+        return float(n)
+    return (1.0 - (1.0 + r) ** (-n)) / r
+
+
+# helper: nominal → effective annual
+@lru_cache(maxsize=256)
+def _semi_to_effective_annual(j: float) -> float:
+    """Convert nominal j (semi-annual) to effective annual rate (EAR)."""
+    return (1.0 + j / 2.0) ** 2 - 1.0
+
+
+# helper: effective annual → per-period rate
+@lru_cache(maxsize=256)
+def _effective_to_periodic(ear: float, m: int) -> float:
+    """Convert EAR to a per-period rate for m payments per year."""
+    return (1.0 + ear) ** (1.0 / m) - 1.0
+
+
+# helper: build a payment function with the factors baked in
+def _specialize(
+    f12: float, f24: float, f26: float, f52: float
+) -> Callable[[float], Tuple[float, ...]]:
+    """
+    Writes out and compiles a tiny function where the four factors are literal
+    constants, so each call is only the multiplies (no lookups, no pow).
+    It returns the unrounded (monthly, semi_monthly, bi_weekly, weekly,
+    rapid_bi_weekly, rapid_weekly).
+    """
+    # repr() of a float round-trips exactly, so the constants lose nothing.
+    src = (
+        "def _pay(p):\n"
+        f"    m = p * {f12!r}\n"
+        f"    return (m, p * {f24!r}, p * {f26!r}, p * {f52!r}, m / 2.0, m / 4.0)\n"
+    )
+    namespace: Dict[str, Any] = {}
+    exec(src, namespace)
+    return namespace["_pay"]
 
 
 class MortgagePayment:
@@ -38,66 +102,76 @@ class MortgagePayment:
         """
         self.__quoted_rate_pct: float = 0.0
         self.__amort_years: int = 0
+        # payment per $1 of principal, keyed by payments per year (filled by the setters)
+        self.__factors: Dict[int, float] = {}
+        # the same factors compiled into one function (see _specialize)
+        self.__pay: Optional[Callable[[float], Tuple[float, ...]]] = None
+        # last payments() call, so asking again for the same principal is free
+        self.__last_principal: Optional[float] = None
+        self.__last_result: Optional[Payments] = None
         self.set_rate_percent(quoted_rate_percent)
         self.set_amort_years(amort_years)
 
-    # helper: present-value factor
-    @staticmethod
-    def _pva(r: float, n: int) -> float:
-        """Present value of an annuity-immediate. Handles r = 0."""
-        if r == 0:
-            return float(n)
-        return (1.0 - (1.0 + r) ** (-n)) / r
+    # payment per $1 of principal for each level schedule
+    def __refresh_factors(self) -> None:
+        """
+        Recomputes 1 / PVA(r, n) for monthly, semi-monthly, bi-weekly and weekly.
+        These only depend on the rate and amortization, so I redo them whenever a
+        setter changes one of those, and a payment is then just principal * factor.
+        """
+        years = self.__amort_years
+        if not years:
+            # Still inside __init__ (rate set, years not yet); set_amort_years will call me.
+            return
+        # The EAR is the same for every schedule, so I work it out once here
+        # instead of once per frequency.
+        ear = _semi_to_effective_annual(self.__quoted_rate_pct / 100.0)
+        # New rate/term means the remembered payments() result is stale.
+        self.__last_principal = None
+        self.__last_result = None
+        self.__factors = {
+            m: 1.0 / _pva(_effective_to_periodic(ear, m), m * years) for m in _FREQUENCIES
+        }
+        self.__pay = _specialize(*self.__factors.values())
 
-    # helper: nominal → effective annual
     @staticmethod
-    def _semi_to_effective_annual(j: float) -> float:
-        """Convert nominal j (semi-annual) to effective annual rate (EAR)."""
-        return (1.0 + j / 2.0) ** 2 - 1.0
+    def _check_principal(principal: float) -> None:
+        if not isinstance(principal, (int, float)):
+            raise TypeError("principal must be an int or float")
+        if principal < 0:
+            raise ValueError("principal must be non-negative")
 
-    # helper: effective annual → per-period rate
     @staticmethod
-    def _effective_to_periodic(ear: float, m: int) -> float:
-        """Convert EAR to a per-period rate for m payments per year."""
-        return (1.0 + ear) ** (1.0 / m) - 1.0
-
-    # calculate payment for one frequency
-    def _payment_given_frequency(self, principal: float, m_per_year: int) -> float:
-        """Compute the level payment for a given payment frequency."""
-        j = self.__quoted_rate_pct / 100.0
-        ear = self._semi_to_effective_annual(j)
-        r = self._effective_to_periodic(ear, m_per_year)
-        n = m_per_year * self.__amort_years
-        return principal / self._pva(r, n)
+    def _round_payments(raw: Tuple[float, ...]) -> Payments:
+        """Round the six raw payments to cents."""
+        return Payments(*[to_cents(x) for x in raw])
 
     # public method: return all six payments
-    def payments(self, principal: float) -> Tuple[float, float, float, float, float, float]:
+    def payments(self, principal: float) -> Payments:
         """
         Returns (monthly, semi_monthly, bi_weekly, weekly, rapid_bi_weekly, rapid_weekly)
-        after rounding to two decimals.
+        after rounding to two decimals, as a Payments named tuple.
         """
-        if not isinstance(principal, (int, float)):
-            raise TypeError("principal must be an int or float")
-        if principal < 0:
-            raise ValueError("principal must be non-negative")
-
-        monthly = self._payment_given_frequency(principal, 12)
-        semi_monthly = self._payment_given_frequency(principal, 24)
-        bi_weekly = self._payment_given_frequency(principal, 26)
-        weekly = self._payment_given_frequency(principal, 52)
-
-        rapid_bi_weekly = monthly / 2.0
-        rapid_weekly = monthly / 4.0
-
-        r2 = lambda x: round(x + 1e-9, 2)
-        return (
-            r2(monthly),
-            r2(semi_monthly),
-            r2(bi_weekly),
-            r2(weekly),
-            r2(rapid_bi_weekly),
-            r2(rapid_weekly),
-        )
+        self._check_principal(principal)
+        last = self.__last_result
+        if last is not None and principal == self.__last_principal:
+            return last
+        result = self._round_payments(self.__pay(principal))
+        self.__last_principal = principal
+        self.__last_result = result
+        return result
+
+    # public method: same as payments() for many principals at once
+    def payments_batch(self, principals: Iterable[float]) -> List[Payments]:
+        """
+        Returns one payments() tuple per principal (e.g., for an affordability table).
+        The payment function is already specialized, so each principal is just a few multiplies.
+        """
+        principals = list(principals)
+        for principal in principals:
+            self._check_principal(principal)
+        pay = self.__pay
+        return [self._round_payments(pay(principal)) for principal in principals]
 
     # setter methods
     def set_rate_percent(self, quoted_rate_percent: float) -> None:
@@ -106,6 +180,7 @@ class MortgagePayment:
         if quoted_rate_percent < 0 or quoted_rate_percent > 100:
             raise ValueError("quoted_rate_percent must be between 0 and 100")
         self.__quoted_rate_pct = float(quoted_rate_percent)
+        self.__refresh_factors()
 
     def set_amort_years(self, amort_years: int) -> None:
         if not isinstance(amort_years, int):
@@ -113,6 +188,7 @@ class MortgagePayment:
         if amort_years <= 0 or amort_years > 100:
             raise ValueError("amort_years must be between 1 and 100")
         self.__amort_years = amort_years
+        self.__refresh_factors()
 
     # getter methods
     def get_rate_percent(self) -> float: